@@ -0,0 +1,38 @@
+"""
+Helper script to convert the statistics files of a validation data set
+from csv to parquet, which is considerably faster to load, e.g. in the
+web app. Requires pyarrow.
+"""
+
+import argparse
+from pathlib import Path
+
+from activityassure import pandas_utils
+from activityassure.validation_statistics import ValidationStatistics
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "-i",
+        "--input",
+        type=str,
+        help="Directory of the validation data set to convert",
+        default="data/validation_data_sets/activity_validation_data_set",
+        required=False,
+    )
+    parser.add_argument(
+        "--delete-csv",
+        action="store_true",
+        help="Delete the csv files after a successful conversion",
+    )
+    args = parser.parse_args()
+    path = Path(args.input)
+    assert path.is_dir(), f"Invalid path: {path}"
+
+    subdirs = [
+        ValidationStatistics.PROBABILITY_PROFILE_DIR,
+        ValidationStatistics.FREQUENCY_DIR,
+        ValidationStatistics.DURATION_DIR,
+    ]
+    for subdir in subdirs:
+        pandas_utils.convert_to_parquet(path / subdir, keep_csv=not args.delete_csv)
@@ -29,12 +29,20 @@ def detect_household_level_columns(data: pd.DataFrame) -> pd.Index:
     :param data: hetus data
     :return: index containing all columns on household level
     """
-    # count how many different values for each column there are within a single household
-    num_values_per_hh = data.groupby(col.HH.KEY).nunique()
-    # get the columns that always have the same value within a single household
-    hh_data = (num_values_per_hh == 1).all(axis=0)  # type: ignore
-    hh_data = hh_data.loc[hh_data == True]
-    return hh_data.index
+    grouped = data.groupby(col.HH.KEY, sort=False)
+    columns = [c for c in data.columns if c not in col.HH.KEY]
+    # check the columns one by one, comparing each value to the first value of
+    # the respective household; this avoids building a DataFrame containing
+    # the number of different values per household and column
+    hh_columns = []
+    for column in columns:
+        values = data[column]
+        first = grouped[column].transform("first")
+        # missing values are ignored, but each household needs at least one value
+        same = (values.eq(first) | values.isna()) & first.notna()
+        if same.all():
+            hh_columns.append(column)
+    return pd.Index(hh_columns)
 
 
 def compare_hh_size_and_participants(data: pd.DataFrame):
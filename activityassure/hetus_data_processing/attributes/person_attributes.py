@@ -91,11 +91,22 @@ def determine_work_status(row: pd.Series) -> WorkStatus:
 
 @utils.timing
 def determine_work_statuses(persondata: pd.DataFrame) -> pd.Series:
-    results = persondata.apply(determine_work_status, axis=1)
+    columns = [
+        col.Person.WORK_STATUS,
+        col.Person.SELF_DECL_LABOUR_STATUS,
+        col.Person.FULL_OR_PART_TIME,
+    ]
+    codes = persondata[columns]
+    # the work status only depends on a few columns with few distinct values,
+    # so it only needs to be determined once for each combination of values
+    group_ids = codes.groupby(columns, sort=False, dropna=False).ngroup()
+    combinations = codes[~codes.duplicated()]
+    statuses = combinations.apply(determine_work_status, axis=1).to_numpy()
+    results = pd.Series(statuses[group_ids.to_numpy()], index=persondata.index)
     results.name = WorkStatus.title()
     counts = results.value_counts()
     determined = counts[
-        counts.index.to_series().apply(lambda x: x.is_determined())
+        counts.index.to_series().apply(lambda x: WorkStatus(x).is_determined())
     ].sum()
     logging.info(
         f"Determined working status for {determined} out of "
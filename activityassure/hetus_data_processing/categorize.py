@@ -36,7 +36,7 @@ def get_person_data_for_categorization(persondata: pd.DataFrame) -> pd.DataFrame
     # remove persons where key attributes are missing
     pdata = pdata[
         pdata[categorization_attributes.WorkStatus.title()].apply(
-            lambda x: x.is_determined()
+            lambda x: categorization_attributes.WorkStatus(x).is_determined()
         )
     ]
     # select the key attributes to use for categorization
@@ -62,13 +62,17 @@ def get_diary_data_for_categorization(
         categorization_attributes.Sex.title(),
     ]
     data = data.join(persondata.loc[:, columns])
-    # drop diaries of persons with missing key attributes
-    data = data[data[categorization_attributes.WorkStatus.title()].notna()]
-    # calculate additional attributes
+    # calculate additional attributes and add them as new columns to the
+    # joined data; unlike concat, this does not create another copy of the data
     daytype = diary_attributes.determine_day_types(data)
-    data = pd.concat([data, daytype], axis=1)
-    daytype_col = categorization_attributes.DayType.title()
-    data = data[data[daytype_col] != categorization_attributes.DayType.undetermined]
+    data[daytype.name] = daytype
+    # drop diaries of persons with missing key attributes or with undetermined
+    # day type in a single step
+    usable = data[categorization_attributes.WorkStatus.title()].notna() & (
+        daytype != categorization_attributes.DayType.undetermined
+    )
+    if not usable.all():
+        data = data[usable.to_numpy()]
     return data
 
 
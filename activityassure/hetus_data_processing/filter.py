@@ -4,6 +4,7 @@ Functions for filtering HETUS data based on various criteria.
 
 import functools
 from typing import Any, Callable, Iterable
+import numpy as np
 import pandas as pd
 
 
@@ -68,6 +69,29 @@ def filter_by_index(
     :param invert: True if the entries in index should be kept, else false; defaults to True
     :return: the filtered data set
     """
-    inindex = data.index.isin(index)
+    inindex = _index_mask(data.index, index)
     keep = ~inindex if invert else inindex
     return data.loc[keep]
+
+
+def _index_mask(data_index: pd.Index, index: pd.Index) -> np.ndarray:
+    """
+    Determines which entries of data_index are contained in index. If index
+    only contains a subset of the levels of data_index, e.g., the household
+    key for a data set indexed by diary key, only these levels are compared.
+
+    :param data_index: the index of the data to filter
+    :param index: the index used as filter condition
+    :return: boolean array, True for each entry that is contained in index
+    """
+    names = list(index.names)
+    if not index.is_unique or None in names or not set(names) <= set(data_index.names):
+        # fall back to the generic, tuple-based check
+        return np.asarray(data_index.isin(index))
+    # select the levels to compare, in the same order as in index
+    other_levels = [n for n in data_index.names if n not in names]
+    keys = data_index.droplevel(other_levels) if other_levels else data_index
+    if keys.nlevels > 1:
+        keys = keys.reorder_levels(names)
+    # probe the hashtable of the (smaller) filter index once per row
+    return index.get_indexer(keys) >= 0
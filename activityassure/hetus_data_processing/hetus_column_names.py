@@ -167,6 +167,15 @@ class Diary(HetusLevel):
     MAIN_ACTIVITIES_PATTERN = "MACT"
     MAIN_ACTIVITIES_AGG_PATTERN = "PACT"
 
+    #: number of activity time slots per diary (with 10 minute resolution)
+    NUM_TIME_SLOTS = 144
+
+
+#: all main activity columns (MACT1 - MACT144)
+MAIN_ACTIVITY_COLUMNS = pd.Index(
+    [f"{Diary.MAIN_ACTIVITIES_PATTERN}{i}" for i in range(1, Diary.NUM_TIME_SLOTS + 1)]
+)
+
 
 def get_activity_data(data: pd.DataFrame) -> pd.DataFrame:
     """
@@ -176,4 +185,5 @@ def get_activity_data(data: pd.DataFrame) -> pd.DataFrame:
     :param data: HETUS diary data
     :return: view on only the activity data
     """
-    return data.filter(like=Diary.MAIN_ACTIVITIES_PATTERN)
+    # select the known column names directly instead of matching substrings
+    return data[data.columns.intersection(MAIN_ACTIVITY_COLUMNS, sort=False)]
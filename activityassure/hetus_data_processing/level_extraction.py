@@ -32,10 +32,71 @@ def limit_to_columns_by_level(
     """
     # remove index and content columns below the specified level
     columns_to_keep = list(set(data.columns) & set(level.CONTENT))
-    limited_data = data.reset_index().set_index(level.KEY)[columns_to_keep]
+    if not set(level.KEY) <= set(data.index.names):
+        # some key columns are not part of the index
+        return data.reset_index().set_index(level.KEY)[columns_to_keep]
+    # only copy the relevant columns and derive the new index from the
+    # existing one, instead of converting the whole index to columns
+    limited_data = data[columns_to_keep]
+    other_levels = [n for n in data.index.names if n not in level.KEY]
+    index = data.index.droplevel(other_levels) if other_levels else data.index
+    if index.nlevels > 1:
+        index = index.reorder_levels(level.KEY)
+    limited_data.index = index
     return limited_data
 
 
+def get_group_mode(
+    values: pd.Series, group_ids: np.ndarray, num_groups: int
+) -> pd.Index:
+    """
+    Determines the most frequent value of each group. Ties are resolved in
+    favor of the value that occurs first within the group. Missing values
+    are ignored.
+
+    :param values: the values to aggregate
+    :param group_ids: the group number of each value, from 0 to num_groups - 1,
+                      or -1 for values that do not belong to any group
+    :param num_groups: the total number of groups
+    :return: the most frequent value of each group, or NaN for groups without
+             any values
+    """
+    codes, uniques = pd.factorize(values)
+    # the selected value of each group, with -1 marking missing values
+    mode_codes = np.full(num_groups, -1, dtype=np.int64)
+    valid = (codes >= 0) & (group_ids >= 0)
+    if valid.any():
+        # encode each combination of group and value as a single integer
+        combined = group_ids[valid].astype(np.int64) * len(uniques) + codes[valid]
+        pairs, first_positions, counts = np.unique(
+            combined, return_index=True, return_counts=True
+        )
+        pair_groups = pairs // len(uniques)
+        # sort by group, then descending by count, then by first occurrence
+        order = np.lexsort((first_positions, -counts, pair_groups))
+        pair_groups = pair_groups[order]
+        is_first_of_group = np.r_[True, pair_groups[1:] != pair_groups[:-1]]
+        selected = order[is_first_of_group]
+        mode_codes[pair_groups[is_first_of_group]] = pairs[selected] % len(uniques)
+    modes = pd.api.extensions.take(uniques.array, mode_codes, allow_fill=True)
+    return pd.Index(modes)
+
+
+def has_nans(data: pd.DataFrame) -> bool:
+    """
+    Checks whether the data or its index contain any missing values.
+
+    :param data: the data to check
+    :return: True if there is at least one missing value, else False
+    """
+    if isinstance(data.index, pd.MultiIndex):
+        # missing values in a MultiIndex are encoded as -1
+        index_has_nans = any((codes == -1).any() for codes in data.index.codes)
+    else:
+        index_has_nans = data.index.hasnans
+    return index_has_nans or bool(data.isna().to_numpy().any())
+
+
 def group_rows_by_level(
     data: pd.DataFrame, level: Type[col.HetusLevel], agg_mode: bool = False
 ) -> pd.DataFrame:
@@ -48,25 +109,33 @@ def group_rows_by_level(
     :param data: general HETUS data set
     :param level: the desired level
     :param agg_mode: if True, uses the mode (most frequent value) for all
-                        group level data, else the first value,
-                        defaults to False
+                        group level data, else the first row of each group,
+                        which requires consistent groups; defaults to False
     :return: group-level data set
     """
-    start = time.time()
-    # select relevant columns and set country and HID as index
-    grouped = data.groupby(level.KEY)
+    start = time.perf_counter()
     if agg_mode:
+        grouped = data.groupby(level.KEY)
+        # rows with missing key values do not belong to any group
+        group_ids = grouped.ngroup().fillna(-1).to_numpy(dtype=np.int64)
         # select the most frequent value out of each group; this is better if there are different values per
-        # group; this method is much slower than the one below
-        grouped_data = grouped.agg(
-            lambda x: (x.value_counts().index[0]) if len(x) > 0 else np.nan
+        # group; this method is slower than the one below
+        columns = [c for c in data.columns if c not in level.KEY]
+        grouped_data = pd.DataFrame(
+            {c: get_group_mode(data[c], group_ids, grouped.ngroups) for c in columns},
+            index=grouped.size().index,
         )
+    elif list(data.index.names) == level.KEY and not has_nans(data):
+        # assume all values in the group are equal and simply select the first row;
+        # dropping duplicate index entries is much faster than a full groupby, but
+        # only equivalent if the data is indexed by the keys and contains no NaNs
+        grouped_data = data[~data.index.duplicated(keep="first")].sort_index()
     else:
         # assume all values in the group are equal and simply select the first one
-        grouped_data = grouped.first()
+        grouped_data = data.groupby(level.KEY).first()
     logging.info(
         f"Extracted {len(grouped_data)} groups on {level.NAME} level "
-        f"from {len(data)} entries in {time.time() - start:.1f} s"
+        f"from {len(data)} entries in {time.perf_counter() - start:.1f} s"
     )
     return grouped_data
 
@@ -86,12 +155,11 @@ def get_consistent_groups(data: pd.DataFrame, level: Type[col.HetusLevel]) -> pd
     data = data[columns_to_keep]
     # get numbers of different values per group for each column
     num_values_per_group = data.groupby(level=level.KEY).nunique(dropna=False)  # type: ignore
-    inconsistent_columns_per_group = (num_values_per_group != 1).sum(axis=1)  # type: ignore
+    # a group is consistent if each column has exactly one value
+    is_consistent = (num_values_per_group.to_numpy() == 1).all(axis=1)
 
     # create an index that contains all consistent groups
-    consistent_groups = inconsistent_columns_per_group[
-        inconsistent_columns_per_group == 0
-    ].index
+    consistent_groups = num_values_per_group.index[is_consistent]
     logging.info(
         f"Out of {len(num_values_per_group)} groups on {level.NAME} level, "
         f"{len(num_values_per_group) - len(consistent_groups)} are inconsistent."
@@ -159,16 +227,41 @@ def get_complete_households(data: pd.DataFrame) -> pd.Index:
     return complete
 
 
+@utils.timing
 def get_usable_household_data(data: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
     """
     Extracts the data on household-level from the specified data set.
     Removes entries with incomplete or inconsistent data.
+    Both conditions are checked using a single grouping of the data.
 
     :param data: general HETUS data set
     :return: filtered full data set and household data set
     """
-    data = filter.filter_by_index(data, get_complete_households(data))
-    return get_usable_data_by_level(data, col.HH)
+    content_columns = list(set(data.columns) & set(col.HH.CONTENT))
+    # add the person IDs as a column to count the participants per household
+    hh_columns = data[content_columns].assign(
+        **{col.Person.ID: data.index.get_level_values(col.Person.ID)}
+    )
+    grouped = hh_columns.groupby(level=col.HH.KEY, sort=False)
+    num_values_per_hh = grouped.nunique(dropna=False)
+    # households where each inhabitant took part in the survey
+    hhsizes = grouped[col.HH.SIZE].first()
+    complete = hhsizes.to_numpy() == num_values_per_hh[col.Person.ID].to_numpy()
+    # households without contradicting household level data
+    consistent = (num_values_per_hh[content_columns].to_numpy() == 1).all(axis=1)
+    logging.info(
+        f"Out of {len(num_values_per_hh)} households, {(~complete).sum()} are "
+        f"incomplete and {(~consistent).sum()} are inconsistent."
+    )
+    # map the household mask to the rows using the group numbers, which
+    # avoids looking up each row in an index of usable households; rows
+    # with missing key values have no group number and get the appended False
+    usable = np.append(complete & consistent, False)
+    group_ids = grouped.ngroup().fillna(-1).to_numpy(dtype=np.int64)
+    data = data[usable[group_ids]]
+    hhdata = limit_to_columns_by_level(data, col.HH)
+    hhdata = group_rows_by_level(hhdata, col.HH, False)
+    return data, hhdata
 
 
 def get_usable_person_data(data: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
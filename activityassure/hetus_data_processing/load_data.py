@@ -5,16 +5,19 @@ Functions for loading HETUS data files.
 import argparse
 import functools
 import getpass
-from io import StringIO
+import importlib.util
+from io import BytesIO, StringIO
 import os
 import time
-from typing import Iterable
+from typing import Any, Iterable
+import numpy as np
 import pandas as pd
 import logging
 
 from cryptography.fernet import Fernet
 
 from activityassure import utils
+import activityassure.hetus_data_processing.hetus_column_names as col
 
 
 HETUS_FILENAME_PREFIX = "TUS_SUF_A_"
@@ -88,6 +91,45 @@ def build_dtype_dict() -> dict[str, type]:
     return {col + str(i): str for col in columns for i in range(1, 145)}
 
 
+def shrink_dtypes(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Converts columns to smaller dtypes to reduce memory usage and speed up
+    all subsequent operations on the data. Integer columns are downcast to
+    the smallest signed integer type that can hold their values. Text
+    columns with few distinct values are converted to categoricals. Key
+    columns and diary code columns, which are translated later on, are left
+    unchanged.
+
+    Note that arithmetic on the downcast columns wraps around silently if
+    the result exceeds the range of the new type (e.g., 100 + 100 is -56 for
+    int8), so convert the columns to a larger type before such calculations.
+
+    :param data: HETUS data
+    :return: HETUS data with smaller dtypes
+    """
+    excluded = set(col.Diary.KEY) | {c.upper() for c in build_dtype_dict()}
+    columns = [c for c in data.columns if c not in excluded]
+    # only numpy integer columns, as nullable integers can contain missing values
+    int_columns = [c for c in columns if data[c].dtype.kind in "iu"]
+    minima, maxima = data[int_columns].min(), data[int_columns].max()
+    dtypes: dict[str, Any] = {}
+    for column in int_columns:
+        for dtype in (np.int8, np.int16, np.int32):
+            info = np.iinfo(dtype)
+            if info.min <= minima[column] and maxima[column] <= info.max:
+                dtypes[column] = dtype
+                break
+    for column in columns:
+        values = data[column]
+        if (
+            pd.api.types.is_string_dtype(values.dtype)
+            and values.nunique() < len(values) / 2
+        ):
+            dtypes[column] = "category"
+    # convert all columns at once instead of assigning them one by one
+    return data.astype(dtypes)
+
+
 def prompt_for_key() -> str:
     """
     Creates a terminal prompt to enter a decryption key.
@@ -128,27 +170,62 @@ def decrypt_file(path: str, key: str) -> str:
     return decrypted
 
 
-def load_hetus_file_from_path(path: str, key: str | None = None) -> pd.DataFrame:
+def read_hetus_csv(source: StringIO | str, use_pyarrow: bool = False) -> pd.DataFrame:
+    """
+    Parses the content of a HETUS file.
+
+    :param source: path or content of the HETUS file
+    :param use_pyarrow: if True, uses the multithreaded csv reader of pyarrow,
+                        which is considerably faster for large files; requires
+                        pyarrow, defaults to False
+    :return: the parsed HETUS data
+    """
+    if use_pyarrow and importlib.util.find_spec("pyarrow") is None:
+        logging.warning("pyarrow is not installed, using the pandas csv reader.")
+        use_pyarrow = False
+    if not use_pyarrow:
+        return pd.read_csv(source, dtype=build_dtype_dict())
+    import pyarrow as pa
+    import pyarrow.csv
+
+    if isinstance(source, StringIO):
+        source = BytesIO(source.getvalue().encode())  # type: ignore
+    # parse the diary columns as str so that leading zeros are not lost
+    convert_options = pyarrow.csv.ConvertOptions(
+        column_types={c: pa.string() for c in build_dtype_dict()},
+        strings_can_be_null=True,
+    )
+    table = pyarrow.csv.read_csv(source, convert_options=convert_options)
+    data = table.to_pandas()
+    # pandas parses columns without any values as float, pyarrow as object
+    empty_columns = [f.name for f in table.schema if pa.types.is_null(f.type)]
+    data[empty_columns] = data[empty_columns].astype(float)
+    return data
+
+
+def load_hetus_file_from_path(
+    path: str, key: str | None = None, use_pyarrow: bool = False
+) -> pd.DataFrame:
     """
     Loads a single HETUS file
 
     :param path: the path of the file
     :param key: the key if the data file is encrypted, else None
+    :param use_pyarrow: whether to parse the file with pyarrow, defaults to False
     :return: HETUS data from the file
     """
     assert os.path.isfile(path), f"File not found: {path}"
     logging.debug(f"Loading HETUS file for {get_country(path)}")
-    start = time.time()
+    start = time.perf_counter()
     if key:
         decrypted = decrypt_file(path, key)
         source: StringIO | str = StringIO(decrypted)
     else:
         source = path
 
-    DTYPE_DICT = build_dtype_dict()
-    data = pd.read_csv(source, dtype=DTYPE_DICT)
+    data = read_hetus_csv(source, use_pyarrow)
     logging.info(
-        f"Loaded HETUS file for {get_country(path)} with {len(data)} entries and {len(data.columns)} columns in {time.time() - start:.1f} s"
+        f"Loaded HETUS file for {get_country(path)} with {len(data)} entries and {len(data.columns)} columns in {time.perf_counter() - start:.1f} s"
     )
     if len(data) == 0:
         raise utils.ActValidatorException(
@@ -160,24 +237,30 @@ def load_hetus_file_from_path(path: str, key: str | None = None) -> pd.DataFrame
     return data
 
 
-def load_hetus_file(country: str, path: str, key: str | None = None) -> pd.DataFrame:
+def load_hetus_file(
+    country: str, path: str, key: str | None = None, use_pyarrow: bool = False
+) -> pd.DataFrame:
     """
     Loads HETUS data of a sinlge country
 
     :param country: the country code (e.g., "DE" for germany)
     :param path: the HETUS data folder, defaults to HETUS_PATH
     :param key: the key if the data file is encrypted, else None
+    :param use_pyarrow: whether to parse the file with pyarrow, defaults to False
     :raises RuntimeError: invalid country code
     :return: HETUS data for the country
     """
     filenames = get_hetus_file_names(path)
     if country.upper() not in filenames.keys():
         raise RuntimeError(f"No HETUS file for country '{country}' found")
-    return load_hetus_file_from_path(filenames[country], key)
+    return load_hetus_file_from_path(filenames[country], key, use_pyarrow)
 
 
 def load_hetus_files(
-    countries: Iterable[str], path: str, key: str | None = None
+    countries: Iterable[str],
+    path: str,
+    key: str | None = None,
+    use_pyarrow: bool = False,
 ) -> pd.DataFrame:
     """
     Loads HETUS data of multiple countries.
@@ -185,32 +268,41 @@ def load_hetus_files(
     :param countries: a list of country codes (e.g., "DE" for germany)
     :param path: the HETUS data folder, defaults to HETUS_PATH
     :param key: the key if the data file is encrypted, else None
+    :param use_pyarrow: whether to parse the files with pyarrow, defaults to False
     :return: HETUS data for the countries
     """
-    data = pd.concat(load_hetus_file(country, path, key) for country in countries)
+    data = pd.concat(
+        load_hetus_file(country, path, key, use_pyarrow) for country in countries
+    )
     return data
 
 
-def load_all_hetus_files(path: str, key: str | None = None) -> pd.DataFrame:
+def load_all_hetus_files(
+    path: str, key: str | None = None, use_pyarrow: bool = False
+) -> pd.DataFrame:
     """
     Loads all available HETUS files.
 
     :param path: the HETUS data folder, defaults to HETUS_PATH
     :param key: the key if the data file is encrypted, else None
+    :param use_pyarrow: whether to parse the files with pyarrow, defaults to False
     :return: HETUS data for all available countries
     """
-    start = time.time()
+    start = time.perf_counter()
     filenames = get_hetus_file_names(path)
     data = pd.concat(
-        load_hetus_file_from_path(filename, key) for filename in filenames.values()
+        load_hetus_file_from_path(filename, key, use_pyarrow=use_pyarrow)
+        for filename in filenames.values()
     )
     logging.info(
-        f"Loaded all HETUS files with {len(data)} entries in {time.time() - start:.1f} s"
+        f"Loaded all HETUS files with {len(data)} entries in {time.perf_counter() - start:.1f} s"
     )
     return data
 
 
-def load_all_hetus_files_except_AT(path: str, key: str | None = None) -> pd.DataFrame:
+def load_all_hetus_files_except_AT(
+    path: str, key: str | None = None, use_pyarrow: bool = False
+) -> pd.DataFrame:
     """
     Loads all available HETUS files, except for the Austrian file.
     Austria uses 15 minute time slots instead of the usual 10 minute time slots,
@@ -218,15 +310,17 @@ def load_all_hetus_files_except_AT(path: str, key: str | None = None) -> pd.Data
 
     :param path: the HETUS data folder, defaults to HETUS_PATH
     :param key: the key if the data file is encrypted, else None
+    :param use_pyarrow: whether to parse the files with pyarrow, defaults to False
     :return: HETUS data for all available countries except for Austria
     """
-    start = time.time()
+    start = time.perf_counter()
     filenames = get_hetus_file_names(path)
     del filenames["AT"]
     data = pd.concat(
-        load_hetus_file_from_path(filename, key) for filename in filenames.values()
+        load_hetus_file_from_path(filename, key, use_pyarrow=use_pyarrow)
+        for filename in filenames.values()
     )
     logging.info(
-        f"Loaded all HETUS files except for AT with {len(data)} entries in {time.time() - start:.1f} s"
+        f"Loaded all HETUS files except for AT with {len(data)} entries in {time.perf_counter() - start:.1f} s"
     )
     return data
@@ -59,8 +59,12 @@ def prepare_hetus_data(
         ]
         + [c for c in data.columns if c.startswith(col.Diary.MAIN_ACTIVITIES_PATTERN)]
     )
-    data = data[relevant_columns]
+    # convert the columns to smaller dtypes to speed up all further steps
+    data = load_data.shrink_dtypes(data[relevant_columns])
     data.set_index(col.Diary.KEY, inplace=True)
+    # sort the index once, so that all subsequent groupby and filter operations
+    # can work on a lexsorted index
+    data.sort_index(inplace=True)
     activities = hetus_translations.translate_activity_codes(data)
 
     # extract households and persons
@@ -158,6 +162,7 @@ def process_all_hetus_countries_AT_separately(
     hetus_key: str | None = None,
     cat_attributes=None,
     title: str = "",
+    use_pyarrow: bool = False,
 ):
     """
     Generates a full HETUS validation data set for all countries. Processes
@@ -169,6 +174,8 @@ def process_all_hetus_countries_AT_separately(
     :param cat_attributes: categorization attributes to use, defaults to a
                            full categorization
     :param title: title of the validation data set
+    :param use_pyarrow: whether to parse the HETUS files with the faster
+                        pyarrow csv reader, defaults to False
     """
     if not cat_attributes:
         cat_attributes = (
@@ -176,12 +183,12 @@ def process_all_hetus_countries_AT_separately(
         )
     # process AT data separately (different resolution)
     logging.info("--- Processing HETUS data for AT ---")
-    data_at = load_data.load_hetus_files(["AT"], hetus_path, hetus_key)
+    data_at = load_data.load_hetus_files(["AT"], hetus_path, hetus_key, use_pyarrow)
     result_at = process_hetus_2010_data(data_at, cat_attributes, None)
 
     # process remaining countries
     logging.info("--- Processing HETUS data for all countries except AT ---")
-    data = load_data.load_all_hetus_files_except_AT(hetus_path, hetus_key)
+    data = load_data.load_all_hetus_files_except_AT(hetus_path, hetus_key, use_pyarrow)
     result_eu = process_hetus_2010_data(data, cat_attributes, None)
 
     assert (
@@ -213,4 +220,7 @@ if __name__ == "__main__":
     RESULT_PATH = Path("data/validation_data_sets")
 
     title = "activity_validation_data_set"
-    process_all_hetus_countries_AT_separately(HETUS_PATH, RESULT_PATH, key, None, title)
+    # parsing the large HETUS files is much faster with pyarrow, if installed
+    process_all_hetus_countries_AT_separately(
+        HETUS_PATH, RESULT_PATH, key, None, title, use_pyarrow=True
+    )
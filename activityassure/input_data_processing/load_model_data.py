@@ -3,6 +3,8 @@ Functions for loading activity profile data and the respective
 person characteristics.
 """
 
+from concurrent.futures import ProcessPoolExecutor
+import itertools
 import logging
 from activityassure import utils
 from activityassure.activity_profile import SparseActivityProfile
@@ -15,6 +17,10 @@ import json
 #: in input filenames, delimits the person name (first part) from the rest
 FILENAME_PERSON_DELIMITER = "_"
 
+#: minimum number of files per worker process; for fewer files, starting
+#: the processes takes longer than loading the files
+MIN_FILES_PER_WORKER = 8
+
 
 def load_person_characteristics(path: str) -> dict:
     with open(path, encoding="utf-8") as f:
@@ -69,22 +75,47 @@ def load_activity_profiles_from_csv(
     person_trait_file: str,
     resolution: timedelta,
     categories_per_person: bool = False,
+    workers: int = 1,
 ) -> list[SparseActivityProfile]:
-    """Loads the activity profiles in csv format from the specified folder"""
+    """
+    Loads the activity profiles in csv format from the specified folder
+
+    :param path: directory containing the activity profile files
+    :param person_trait_file: path to the person trait file
+    :param resolution: resolution of the activity profiles
+    :param categories_per_person: if True, each person gets their own
+                                  category; defaults to False
+    :param workers: maximum number of processes for loading the files; if 1,
+                    or if there are only a few files, the files are loaded
+                    in the current process; defaults to 1
+    :return: the loaded activity profiles
+    """
     assert Path(path).is_dir(), f"Directory does not exist: {path}"
     person_traits = load_person_characteristics(person_trait_file)
-    activity_profiles = []
-    for filepath in path.iterdir():
-        if filepath.is_file():
-            person = get_person_from_filename(
-                filepath,
-            )
-            profile_type = get_person_traits(
-                person_traits, person, categories_per_person
-            )
-            activity_profile = SparseActivityProfile.load_from_csv(
-                filepath, profile_type, resolution
+    filepaths = [f for f in path.iterdir() if f.is_file()]
+    profile_types = [
+        get_person_traits(
+            person_traits, get_person_from_filename(f), categories_per_person
+        )
+        for f in filepaths
+    ]
+    workers = min(workers, len(filepaths) // MIN_FILES_PER_WORKER)
+    if workers <= 1:
+        activity_profiles = [
+            SparseActivityProfile.load_from_csv(f, profile_type, resolution)
+            for f, profile_type in zip(filepaths, profile_types)
+        ]
+    else:
+        # parse the files in parallel, as each file can be loaded independently
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            activity_profiles = list(
+                executor.map(
+                    SparseActivityProfile.load_from_csv,
+                    filepaths,
+                    profile_types,
+                    itertools.repeat(resolution),
+                    chunksize=max(len(filepaths) // (4 * workers), 1),
+                )
             )
-            activity_profiles.append(activity_profile)
     logging.info(f"Loaded {len(activity_profiles)} activity profiles")
     return activity_profiles
@@ -84,9 +84,10 @@ def determine_day_type(activity_profile: SparseActivityProfile) -> None:
 
     :param activity_profile: the activity profile to check
     """
-    durations = [a.duration for a in activity_profile.activities if is_work_activity(a)]
-    # calculate total working time on this day
-    work_sum = sum(durations)
+    # calculate total working time on this day (in time steps)
+    work_sum = sum(
+        a.duration for a in activity_profile.activities if is_work_activity(a)
+    )
     assert (
         work_sum is not None
     ), "Cannot determine day type for profiles with missing durations"
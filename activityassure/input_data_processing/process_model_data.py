@@ -70,6 +70,7 @@ def process_model_data(
     resolution: timedelta,
     validation_activities: list[str] = [],
     categories_per_person: bool = False,
+    workers: int = 1,
 ) -> ValidationSet:
     """
     Processes the input data to produce the validation statistics.
@@ -84,10 +85,12 @@ def process_model_data(
     :param categories_per_person: if True, the person names will be part of the
                                   person categorization, meaning that each person
                                   will get their own categories; defaults to False
+    :param workers: maximum number of processes for loading the input data
+                    files; defaults to 1
     """
     # load and preprocess all input data
     full_year_profiles = load_model_data.load_activity_profiles_from_csv(
-        input_path, person_trait_file, resolution, categories_per_person
+        input_path, person_trait_file, resolution, categories_per_person, workers
     )
     mapping, activities = activity_mapping.load_mapping_and_activities(mapping_path)
     # check if the activity list matches that of the validation statistics
@@ -6,8 +6,12 @@ import logging
 from pathlib import Path
 import pandas as pd
 
+from activityassure import utils
 from activityassure.profile_category import ProfileCategory
 
+#: file extension of parquet files; these require the optional dependency pyarrow
+PARQUET_EXT = "parquet"
+
 
 def create_result_path(
     path: Path,
@@ -37,6 +41,28 @@ def create_result_path(
     return path
 
 
+def find_result_file(
+    path: Path, name: str, profile_type: ProfileCategory | None = None
+) -> Path | None:
+    """
+    Returns the path of an existing result file, which may either be
+    stored as csv or as parquet file.
+
+    :param path: base directory of the file
+    :param name: base name of the file
+    :param profile_type: the category of the profile data,
+                         if applicable; defaults to None
+    :return: the path of the existing file, or None if there is none
+    """
+    if profile_type is not None:
+        name = profile_type.construct_filename(name)
+    for ext in ("csv", PARQUET_EXT):
+        filepath = path / f"{name}.{ext}"
+        if filepath.is_file():
+            return filepath
+    return None
+
+
 def save_df(
     data: pd.DataFrame | pd.Series,
     path: Path,
@@ -63,15 +89,18 @@ def save_df(
 
 def load_df(path: Path, timedelta_index: bool = False) -> pd.DataFrame:
     """
-    Loads a DataFrame from a csv file.
+    Loads a DataFrame from a csv or parquet file.
 
-    :param path: path to the csv file
+    :param path: path to the csv or parquet file
     :param as_timedelta: whether the index of the DataFrame consists of timedeltas,
                          defaults to False
     :return: the loaded DataFrame
     """
     # load the data
-    data = pd.read_csv(path, index_col=0)
+    if path.suffix == f".{PARQUET_EXT}":
+        data = pd.read_parquet(path)
+    else:
+        data = pd.read_csv(path, index_col=0)
     if timedelta_index:
         # convert the index to timedeltas
         data.index = pd.to_timedelta(data.index)
@@ -79,6 +108,32 @@ def load_df(path: Path, timedelta_index: bool = False) -> pd.DataFrame:
     return data
 
 
+def convert_to_parquet(directory: Path, keep_csv: bool = True) -> None:
+    """
+    Converts all csv files in a directory to parquet files, which are
+    faster to load. Requires pyarrow.
+
+    :param directory: the directory containing the csv files
+    :param keep_csv: if False, each csv file is removed after checking that
+                     the parquet file contains the same data; defaults to True
+    :raises ActValidatorException: if a parquet file does not contain the
+                                   same data as the csv file
+    """
+    for path in directory.glob("*.csv"):
+        data = pd.read_csv(path, index_col=0)
+        parquet_path = path.with_suffix(f".{PARQUET_EXT}")
+        data.to_parquet(parquet_path)
+        if keep_csv:
+            continue
+        # only delete the source file if the conversion was lossless
+        if not pd.read_parquet(parquet_path).equals(data):
+            raise utils.ActValidatorException(
+                f"Converting '{path}' to parquet changed the data"
+            )
+        path.unlink()
+    logging.info(f"Converted all csv files in {directory} to parquet")
+
+
 def split_data(data: pd.DataFrame) -> list[pd.DataFrame]:
     """
     Randomly split a dataframe into half.
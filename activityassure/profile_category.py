@@ -3,6 +3,7 @@ Contains a class for specifying a category of activity profiles,
 including all associated attribute values.
 """
 
+import functools
 from pathlib import Path
 from typing import Any, Collection, Sequence
 from dataclasses import dataclass
@@ -79,6 +80,7 @@ class ProfileCategory:
         """
         return "_".join(str(c) for c in self.to_list())
 
+    @functools.lru_cache(maxsize=256)
     def construct_filename(self, name: str = "") -> str:
         return f"{name}_{self}"
 
@@ -95,6 +97,7 @@ class ProfileCategory:
         )
 
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def from_filename(filepath: Path) -> "ProfileCategory":
         components = filepath.stem.split("_")
         assert (
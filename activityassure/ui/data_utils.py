@@ -2,12 +2,15 @@
 Helper functions for handling data, paths and labels for the web app.
 """
 
-import glob
+from collections.abc import Mapping
+import functools
+import os
 from pathlib import Path
+from types import MappingProxyType
 import pandas as pd
 from plotly.graph_objects import Figure  # type: ignore
 
-from activityassure import activity_mapping
+from activityassure import activity_mapping, pandas_utils
 from activityassure.ui import datapaths
 from activityassure.profile_category import ProfileCategory
 from activityassure.validation_statistics import ValidationSet
@@ -21,22 +24,76 @@ def ptype_from_label(profile_type_str: str) -> ProfileCategory:
     return ProfileCategory.from_iterable(profile_type_str.split(" - "))
 
 
-def get_files(path: Path) -> list[Path]:
+# the following functions cache their results and return immutable objects,
+# as the results are shared between all callers
+
+
+@functools.lru_cache(maxsize=32)
+def get_files(path: Path) -> tuple[Path, ...]:
     assert path.exists(), f"Invalid path: {path}"
-    return [f for f in path.iterdir() if f.is_file()]
+    # scandir entries cache the file type, avoiding an extra stat call per file
+    with os.scandir(path) as it:
+        return tuple(Path(e.path) for e in it if e.is_file())
 
 
-def get_profile_type_paths(path: Path) -> dict[ProfileCategory, Path]:
+@functools.lru_cache(maxsize=32)
+def get_profile_type_paths(path: Path) -> Mapping[ProfileCategory, Path]:
     input_prob_files = get_files(path)
     profile_types = {ProfileCategory.from_filename(p): p for p in input_prob_files}
     if None in profile_types:
         raise RuntimeError("Invalid file name: could not parse profile type")
-    return profile_types  # type: ignore
+    return MappingProxyType(profile_types)  # type: ignore
+
+
+@functools.lru_cache(maxsize=32)
+def get_profile_type_labels(path: Path) -> tuple[str, ...]:
+    # resolve the path so that each directory is only scanned once
+    profile_types = get_profile_type_paths(path.resolve())
+    return tuple(ptype_to_label(p) for p in profile_types.keys())
+
+
+@functools.lru_cache(maxsize=32)
+def get_all_profile_type_labels(path_val: Path, path_in: Path) -> tuple[str, ...]:
+    """
+    Returns the sorted labels of all profile types that occur in
+    at least one of the two directories.
+
+    :param path_val: directory with validation data
+    :param path_in: directory with input data
+    :return: sorted tuple of unique profile type labels
+    """
+    labels = get_profile_type_labels(path_val) + get_profile_type_labels(path_in)
+    # remove duplicates in a single pass
+    return tuple(sorted(dict.fromkeys(labels)))
 
 
-def get_profile_type_labels(path: Path) -> list[str]:
-    profile_types = get_profile_type_paths(path)
-    return [ptype_to_label(p) for p in profile_types.keys()]
+@functools.lru_cache(maxsize=32)
+def _index_files(
+    directory: Path, ext: str
+) -> Mapping[ProfileCategory, tuple[Path, ...]]:
+    """
+    Scans a directory once and collects all files per ProfileCategory.
+
+    :param directory: the directory to scan
+    :param ext: file extension of the files to include, or "*" for all files
+    :return: dict mapping each ProfileCategory to its matching files
+    """
+    index: dict[ProfileCategory, list[Path]] = {}
+    if not directory.is_dir():
+        return MappingProxyType({})
+    suffix = f".{ext}"
+    with os.scandir(directory) as it:
+        for entry in it:
+            if not entry.is_file() or (ext != "*" and not entry.name.endswith(suffix)):
+                continue
+            path = Path(entry.path)
+            try:
+                profile_type = ProfileCategory.from_filename(path)
+            except (AssertionError, ValueError):
+                # file name does not contain a profile type
+                continue
+            index.setdefault(profile_type, []).append(path)
+    return MappingProxyType({k: tuple(v) for k, v in index.items()})
 
 
 def get_file_path(
@@ -52,16 +109,72 @@ def get_file_path(
     :raises RuntimeError: if the file could not be identified unambiguously
     :return: the path of the matching file, or None if no file was found
     """
-    filter = directory / ("*" + profile_type.construct_filename() + f".{ext}")
-
-    # find the correct file
-    files = glob.glob(str(filter))
+    files = _index_files(directory, ext).get(profile_type, ())
     if len(files) == 0:
         # no file for this profile type exists in this directory
         return None
     if len(files) > 1:
         raise RuntimeError(f"Found multiple files for the same profile type: {files}")
-    return Path(files[0])
+    return files[0]
+
+
+@functools.lru_cache(maxsize=128)
+def get_statistics_paths(
+    base_path: Path, profile_type: ProfileCategory
+) -> Mapping[str, Path | None]:
+    """
+    Looks up the statistics files belonging to a specific ProfileCategory
+    in all data subdirectories at once.
+
+    :param base_path: base path of the data set
+    :param profile_type: the ProfileCategory for which to look up the paths
+    :return: dict mapping each data subdirectory to the path of the matching
+             file, or None if no file was found
+    """
+    subdirs = [datapaths.prob_dir, datapaths.freq_dir, datapaths.duration_dir]
+    return MappingProxyType(
+        {subdir: get_file_path(base_path / subdir, profile_type) for subdir in subdirs}
+    )
+
+
+@functools.lru_cache(maxsize=64)
+def _load_df_cached(path: Path, timedelta_index: bool) -> pd.DataFrame:
+    data = pandas_utils.load_df(path, timedelta_index)
+    # store repeated text values as categories to save memory
+    for column in data.select_dtypes(include=["object", "string"]).columns:
+        data[column] = data[column].astype("category")
+    return data
+
+
+def load_df(path: Path, timedelta_index: bool = False) -> pd.DataFrame:
+    """
+    Loads a DataFrame from a csv file. The web app shows the same files
+    many times, so loaded files are kept in an in-memory cache.
+    A shallow copy is returned, so callers can e.g. replace the index
+    without affecting the cached DataFrame, but must not modify the
+    data in place.
+
+    :param path: path to the csv file
+    :param timedelta_index: whether the index of the DataFrame consists of
+                            timedeltas, defaults to False
+    :return: the loaded DataFrame
+    """
+    return _load_df_cached(path, timedelta_index).copy(deep=False)
+
+
+def invalidate_file_cache():
+    """
+    Clears all cached directory listings and loaded files, so that new or
+    regenerated statistics files are picked up. Is called whenever the
+    validation page is loaded.
+    """
+    get_files.cache_clear()
+    get_profile_type_paths.cache_clear()
+    get_profile_type_labels.cache_clear()
+    get_all_profile_type_labels.cache_clear()
+    _index_files.cache_clear()
+    get_statistics_paths.cache_clear()
+    _load_df_cached.cache_clear()
 
 
 def get_final_activity_order(
@@ -5,6 +5,7 @@ for validation.
 
 from pathlib import Path
 
+from activityassure import pandas_utils
 from activityassure.validation_statistics import ValidationStatistics
 from activityassure.ui.config import config
 
@@ -32,12 +33,12 @@ def check_paths():
     for subdir in subdirs:
         path = validation_path / subdir
         assert path.is_dir(), f"Validation data incomplete: {subdir} missing"
-        assert len(
-            list(path.glob("*.csv"))
-        ), f"Validation subdirectory {subdir} contains no .csv files"
+        assert any(
+            p.suffix in (".csv", f".{pandas_utils.PARQUET_EXT}") for p in path.iterdir()
+        ), f"Validation subdirectory {subdir} contains no .csv or .parquet files"
         path = input_data_path / subdir
         assert path.is_dir(), f"Input data incomplete: {subdir} missing"
-        assert len(list(path.glob("*"))), f"Input subdirectory {subdir} is empty"
+        assert any(path.iterdir()), f"Input subdirectory {subdir} is empty"
 
 
 check_paths()
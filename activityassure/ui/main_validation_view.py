@@ -1,4 +1,4 @@
-from dash import Output, Input, State, html, dcc, callback, no_update, MATCH  # type: ignore
+from dash import Output, Input, State, html, dcc, callback, ctx, no_update, MATCH  # type: ignore
 import dash_bootstrap_components as dbc  # type: ignore
 import uuid
 
@@ -72,6 +72,13 @@ class MainValidationView(html.Div):
                 "aio_id": aio_id,
             }
 
+        def store(aio_id):
+            return {
+                "component": "MainValidationView",
+                "subcomponent": "store",
+                "aio_id": aio_id,
+            }
+
     synchronize_option = "Synchronize data types"
 
     # Define the arguments of the component
@@ -95,14 +102,27 @@ class MainValidationView(html.Div):
             # if not set by user, define a random ID
             aio_id = str(uuid.uuid4())
 
+        # Define the component's layout
+        super().__init__(_build_layout(aio_id, dropdown_props))
+
+    @callback(
+        Output(ids.dropdown_valid(MATCH), "options"),
+        Output(ids.dropdown_valid(MATCH), "value"),
+        Output(ids.dropdown_input(MATCH), "options"),
+        Output(ids.dropdown_input(MATCH), "value"),
+        Output(ids.checklist_sync(MATCH), "value"),
+        Input(ids.store(MATCH), "data"),
+    )
+    def populate_dropdowns(_):
+        # this is called on each page load, so reloading the page picks up
+        # new or regenerated statistics files
+        data_utils.invalidate_file_cache()
         # get available profile categories
-        validation_types = data_utils.get_profile_type_labels(
-            datapaths.validation_path / datapaths.prob_dir
-        )
-        input_types = data_utils.get_profile_type_labels(
-            datapaths.input_data_path / datapaths.prob_dir
-        )
-        all_types = sorted(list(set(validation_types) | set(input_types)))
+        path_val = datapaths.validation_path / datapaths.prob_dir
+        path_in = datapaths.input_data_path / datapaths.prob_dir
+        validation_types = data_utils.get_profile_type_labels(path_val)
+        input_types = data_utils.get_profile_type_labels(path_in)
+        all_types = data_utils.get_all_profile_type_labels(path_val, path_in)
         common_types = sorted(list(set(validation_types) & set(input_types)))
         if not common_types:
             # no common categories - select the first category each
@@ -114,187 +134,10 @@ class MainValidationView(html.Div):
             initial_val = common_types[0]
             initial_input = common_types[0]
             initial_sync = [MainValidationView.synchronize_option]
-
-        # Define the component's layout
-        super().__init__(
-            dbc.Card(
-                dbc.CardBody(
-                    [
-                        # dcc.Store(data=str(validation_path), id=self.ids.store(aio_id)),
-                        dbc.Card(
-                            dbc.CardBody(
-                                [
-                                    dbc.Row(
-                                        [
-                                            dbc.Col(
-                                                dbc.Row(
-                                                    [
-                                                        html.H4(
-                                                            "Validation Profile Category",
-                                                            className="mb-3",
-                                                        ),
-                                                        html.H4(
-                                                            config.model_name
-                                                            + " Profile Category",
-                                                            className="mb-3",
-                                                        ),
-                                                    ]
-                                                ),
-                                                width="auto",
-                                            ),
-                                            dbc.Col(
-                                                dbc.Row(
-                                                    [
-                                                        dcc.Dropdown(
-                                                            validation_types,
-                                                            initial_val,
-                                                            id=self.ids.dropdown_valid(
-                                                                aio_id
-                                                            ),
-                                                            className="mb-3",
-                                                            **dropdown_props,
-                                                        ),
-                                                        dcc.Dropdown(
-                                                            all_types,
-                                                            initial_input,
-                                                            id=self.ids.dropdown_input(
-                                                                aio_id
-                                                            ),
-                                                            className="mb-3",
-                                                            **dropdown_props,
-                                                        ),
-                                                    ]
-                                                ),
-                                                width=3,
-                                            ),
-                                            dbc.Col(
-                                                dcc.Checklist(
-                                                    options=[
-                                                        MainValidationView.synchronize_option
-                                                    ],
-                                                    value=initial_sync,
-                                                    id=self.ids.checklist_sync(aio_id),
-                                                )
-                                            ),
-                                        ],
-                                    ),
-                                ]
-                            ),
-                            className="mb-3",
-                        ),
-                        dbc.Card(
-                            dbc.CardBody(
-                                [
-                                    html.Div(
-                                        children=[
-                                            html.H2(
-                                                "Validation Data",
-                                                style={"textAlign": "center"},
-                                            ),
-                                            dcc.Loading(
-                                                type="circle",
-                                                id=self.ids.validation_graph(aio_id),
-                                            ),
-                                        ],
-                                    ),
-                                    html.Div(
-                                        children=[
-                                            html.H2(
-                                                config.model_name + " Data",
-                                                style={"textAlign": "center"},
-                                            ),
-                                            dcc.Loading(
-                                                type="circle",
-                                                id=self.ids.input_graph(aio_id),
-                                            ),
-                                        ],
-                                    ),
-                                    html.Div(
-                                        children=[
-                                            html.H2(
-                                                "Difference",
-                                                style={"textAlign": "center"},
-                                            ),
-                                            dcc.Loading(
-                                                type="circle",
-                                                id=self.ids.difference_graph(aio_id),
-                                            ),
-                                        ],
-                                    ),
-                                ]
-                            ),
-                            className="mb-3",
-                        ),
-                        dcc.Loading(
-                            type="circle",
-                            id=self.ids.kpi_view(aio_id),
-                            className="mb-3",
-                        ),
-                        html.Br(),
-                        html.Div(
-                            children=[
-                                html.Div(
-                                    [
-                                        dbc.Row(
-                                            [
-                                                dbc.Col(
-                                                    dbc.Card(
-                                                        html.H2(
-                                                            "Activity Frequencies per Day",
-                                                            style={
-                                                                "textAlign": "center"
-                                                            },
-                                                        )
-                                                    )
-                                                ),
-                                                dbc.Col(
-                                                    dbc.Card(
-                                                        html.H2(
-                                                            "Activity Durations",
-                                                            style={
-                                                                "textAlign": "center"
-                                                            },
-                                                        )
-                                                    )
-                                                ),
-                                                dbc.Col(
-                                                    dbc.Card(
-                                                        html.H2(
-                                                            "Activity Probabilities",
-                                                            style={
-                                                                "textAlign": "center"
-                                                            },
-                                                        )
-                                                    )
-                                                ),
-                                                dbc.Col(
-                                                    dbc.Card(
-                                                        html.H2(
-                                                            "Comparison Metrics",
-                                                            style={
-                                                                "textAlign": "center"
-                                                            },
-                                                        )
-                                                    )
-                                                ),
-                                            ],
-                                            className="mb-3",
-                                        ),
-                                        dcc.Loading(
-                                            type="circle",
-                                            id=self.ids.per_activity_graphs(aio_id),
-                                        ),
-                                    ],
-                                )
-                            ],
-                        ),
-                    ],
-                )
-            )
-        )
+        return validation_types, initial_val, all_types, initial_input, initial_sync
 
     @callback(
-        Output(ids.dropdown_input(MATCH), "value"),
+        Output(ids.dropdown_input(MATCH), "value", allow_duplicate=True),
         Input(ids.dropdown_valid(MATCH), "value"),
         Input(ids.checklist_sync(MATCH), "value"),
         State(ids.dropdown_input(MATCH), "value"),
@@ -323,40 +166,43 @@ class MainValidationView(html.Div):
 
     @callback(
         Output(ids.validation_graph(MATCH), "children"),
-        Input(ids.dropdown_valid(MATCH), "value"),
-    )
-    def update_validation_graph(profile_type_str: str):
-        return plots.update_stacked_prob_curves(
-            profile_type_str, datapaths.validation_path / datapaths.prob_dir
-        )
-
-    @callback(
         Output(ids.input_graph(MATCH), "children"),
-        Input(ids.dropdown_input(MATCH), "value"),
-    )
-    def update_input_graph(profile_type_str: str):
-        return plots.update_stacked_prob_curves(
-            profile_type_str, datapaths.input_data_path / datapaths.prob_dir
-        )
-
-    @callback(
         Output(ids.difference_graph(MATCH), "children"),
         Input(ids.dropdown_valid(MATCH), "value"),
         Input(ids.dropdown_input(MATCH), "value"),
     )
-    def update_diff_graph(profile_type_valid: str, profile_type_input: str):
+    def update_prob_graphs(profile_type_valid: str, profile_type_input: str):
+        if not profile_type_valid or not profile_type_input:
+            # dropdowns not populated yet
+            return no_update, no_update, no_update
         profile_type_val = data_utils.ptype_from_label(profile_type_valid)
-        filepath_val = data_utils.get_file_path(
-            datapaths.validation_path / datapaths.prob_dir, profile_type_val
-        )
+        filepath_val = data_utils.get_statistics_paths(
+            datapaths.validation_path, profile_type_val
+        )[datapaths.prob_dir]
         profile_type_in = data_utils.ptype_from_label(profile_type_input)
-        filepath_in = data_utils.get_file_path(
-            datapaths.input_data_path / datapaths.prob_dir, profile_type_in
-        )
-        figure = plots.stacked_diff_curve(filepath_val, filepath_in)
+        filepath_in = data_utils.get_statistics_paths(
+            datapaths.input_data_path, profile_type_in
+        )[datapaths.prob_dir]
+        # load each file only once and use it for all three graphs
+        data_val = plots.load_prob_data(filepath_val)
+        data_in = plots.load_prob_data(filepath_in)
+        # only rerender the graphs whose dropdown changed; the difference
+        # graph depends on both and is always updated
+        triggered = {t["subcomponent"] for t in ctx.triggered_prop_ids.values()}
+        validation_graph = no_update
+        if not triggered or "dropdown_validation" in triggered:
+            validation_graph = plots.update_stacked_prob_curves(
+                data_val, profile_type_val, "validation"
+            )
+        input_graph = no_update
+        if not triggered or "dropdown_input" in triggered:
+            input_graph = plots.update_stacked_prob_curves(
+                data_in, profile_type_in, config.model_name
+            )
+        figure = plots.stacked_diff_curve(data_val, data_in)
         if not figure:
-            return plots.replacement_text()
-        return [
+            return validation_graph, input_graph, plots.replacement_text()
+        diff_graph = [
             dcc.Graph(
                 figure=data_utils.save_plot(
                     figure,
@@ -366,6 +212,7 @@ class MainValidationView(html.Div):
                 )
             )
         ]
+        return validation_graph, input_graph, diff_graph
 
     @callback(
         Output(ids.kpi_view(MATCH), "children"),
@@ -373,6 +220,9 @@ class MainValidationView(html.Div):
         Input(ids.dropdown_input(MATCH), "value"),
     )
     def update_overall_kpis(profile_type_valid: str, profile_type_input: str):
+        if not profile_type_valid or not profile_type_input:
+            # dropdowns not populated yet
+            return no_update
         ptype_val = data_utils.ptype_from_label(profile_type_valid)
         ptype_in = data_utils.ptype_from_label(profile_type_input)
         try:
@@ -401,6 +251,9 @@ class MainValidationView(html.Div):
     def update_graphs_per_activity_type(
         profile_type_valid: str, profile_type_input: str
     ):
+        if not profile_type_valid or not profile_type_input:
+            # dropdowns not populated yet
+            return no_update
         ptype_val = data_utils.ptype_from_label(profile_type_valid)
         ptype_in = data_utils.ptype_from_label(profile_type_input)
         freq = plots.histogram_per_activity(ptype_val, ptype_in, datapaths.freq_dir)
@@ -431,3 +284,188 @@ class MainValidationView(html.Div):
             for a in plots.ACTIVITY_ORDER
         ]
         return rows
+
+
+def _build_layout(aio_id: str, dropdown_props: dict) -> dbc.Card:
+    """
+    Builds the layout of a MainValidationView component.
+
+    :param aio_id: the All-in-One component ID to use for all subcomponents
+    :param dropdown_props: additional properties for the dropdowns
+    :return: the root component of the layout
+    """
+    return dbc.Card(
+        dbc.CardBody(
+            [
+                # triggers populating the dropdowns once the component is rendered
+                dcc.Store(id=MainValidationView.ids.store(aio_id)),
+                dbc.Card(
+                    dbc.CardBody(
+                        [
+                            dbc.Row(
+                                [
+                                    dbc.Col(
+                                        dbc.Row(
+                                            [
+                                                html.H4(
+                                                    "Validation Profile Category",
+                                                    className="mb-3",
+                                                ),
+                                                html.H4(
+                                                    config.model_name
+                                                    + " Profile Category",
+                                                    className="mb-3",
+                                                ),
+                                            ]
+                                        ),
+                                        width="auto",
+                                    ),
+                                    dbc.Col(
+                                        dbc.Row(
+                                            [
+                                                dcc.Dropdown(
+                                                    [],
+                                                    None,
+                                                    id=MainValidationView.ids.dropdown_valid(
+                                                        aio_id
+                                                    ),
+                                                    className="mb-3",
+                                                    **dropdown_props,
+                                                ),
+                                                dcc.Dropdown(
+                                                    [],
+                                                    None,
+                                                    id=MainValidationView.ids.dropdown_input(
+                                                        aio_id
+                                                    ),
+                                                    className="mb-3",
+                                                    **dropdown_props,
+                                                ),
+                                            ]
+                                        ),
+                                        width=3,
+                                    ),
+                                    dbc.Col(
+                                        dcc.Checklist(
+                                            options=[
+                                                MainValidationView.synchronize_option
+                                            ],
+                                            value=[],
+                                            id=MainValidationView.ids.checklist_sync(
+                                                aio_id
+                                            ),
+                                        )
+                                    ),
+                                ],
+                            ),
+                        ]
+                    ),
+                    className="mb-3",
+                ),
+                dbc.Card(
+                    dbc.CardBody(
+                        [
+                            html.Div(
+                                children=[
+                                    html.H2(
+                                        "Validation Data",
+                                        style={"textAlign": "center"},
+                                    ),
+                                    dcc.Loading(
+                                        type="circle",
+                                        id=MainValidationView.ids.validation_graph(
+                                            aio_id
+                                        ),
+                                    ),
+                                ],
+                            ),
+                            html.Div(
+                                children=[
+                                    html.H2(
+                                        config.model_name + " Data",
+                                        style={"textAlign": "center"},
+                                    ),
+                                    dcc.Loading(
+                                        type="circle",
+                                        id=MainValidationView.ids.input_graph(aio_id),
+                                    ),
+                                ],
+                            ),
+                            html.Div(
+                                children=[
+                                    html.H2(
+                                        "Difference",
+                                        style={"textAlign": "center"},
+                                    ),
+                                    dcc.Loading(
+                                        type="circle",
+                                        id=MainValidationView.ids.difference_graph(
+                                            aio_id
+                                        ),
+                                    ),
+                                ],
+                            ),
+                        ]
+                    ),
+                    className="mb-3",
+                ),
+                dcc.Loading(
+                    type="circle",
+                    id=MainValidationView.ids.kpi_view(aio_id),
+                    className="mb-3",
+                ),
+                html.Br(),
+                html.Div(
+                    children=[
+                        html.Div(
+                            [
+                                dbc.Row(
+                                    [
+                                        dbc.Col(
+                                            dbc.Card(
+                                                html.H2(
+                                                    "Activity Frequencies per Day",
+                                                    style={"textAlign": "center"},
+                                                )
+                                            )
+                                        ),
+                                        dbc.Col(
+                                            dbc.Card(
+                                                html.H2(
+                                                    "Activity Durations",
+                                                    style={"textAlign": "center"},
+                                                )
+                                            )
+                                        ),
+                                        dbc.Col(
+                                            dbc.Card(
+                                                html.H2(
+                                                    "Activity Probabilities",
+                                                    style={"textAlign": "center"},
+                                                )
+                                            )
+                                        ),
+                                        dbc.Col(
+                                            dbc.Card(
+                                                html.H2(
+                                                    "Comparison Metrics",
+                                                    style={"textAlign": "center"},
+                                                )
+                                            )
+                                        ),
+                                    ],
+                                    className="mb-3",
+                                ),
+                                dcc.Loading(
+                                    type="circle",
+                                    id=MainValidationView.ids.per_activity_graphs(
+                                        aio_id
+                                    ),
+                                ),
+                            ],
+                        )
+                    ],
+                ),
+            ],
+        )
+    )
@@ -13,7 +13,6 @@ from activityassure.hetus_data_processing import (
     hetus_constants,
 )
 from activityassure import (
-    pandas_utils,
     profile_category,
     validation_statistics,
     comparison_indicators,
@@ -172,11 +171,27 @@ def remove_trailing_zero_rows(data: pd.DataFrame) -> pd.DataFrame:
     return data.iloc[: last_nonzero_position + 1]
 
 
-def stacked_prob_curves(filepath: Path | None) -> Figure | None:
-    if filepath is None or not filepath.is_file():
+def load_prob_data(source: Path | pd.DataFrame | None) -> pd.DataFrame | None:
+    """
+    Returns the probability profiles from the specified source. If a
+    path is passed, the file is loaded, and an already loaded DataFrame
+    is returned directly.
+
+    :param source: path of the probability profile file, or the loaded data
+    :return: the probability profiles, or None if the file does not exist
+    """
+    if isinstance(source, pd.DataFrame):
+        return source
+    if source is None or not source.is_file():
+        return None
+    return data_utils.load_df(source)
+
+
+def stacked_prob_curves(source: Path | pd.DataFrame | None) -> Figure | None:
+    # load the correct file, if necessary
+    data = load_prob_data(source)
+    if data is None:
         return None
-    # load the correct file
-    data = pandas_utils.load_df(filepath)
     # transpose data for plotting
     data = data.T
     data = data_utils.reorder_activities(data, ACTIVITY_ORDER)
@@ -200,38 +215,38 @@ def stacked_prob_curves(filepath: Path | None) -> Figure | None:
     return fig
 
 
-def update_stacked_prob_curves(profile_type_str: str, directory: Path):
-    # load the correct file and plot it
-    profile_type = data_utils.ptype_from_label(profile_type_str)
-    filepath = data_utils.get_file_path(directory, profile_type)
-    figure = stacked_prob_curves(filepath)
+def update_stacked_prob_curves(
+    data: pd.DataFrame | None,
+    profile_type: profile_category.ProfileCategory,
+    name: str,
+):
+    # plot the already loaded data
+    figure = stacked_prob_curves(data)
     if not figure:
         return replacement_text()
 
     data_utils.save_plot(
         figure,
         "probability profiles",
-        name="validation" if "valid" in str(directory).lower() else config.model_name,
+        name=name,
         profile_type=profile_type,
     )
     return [dcc.Graph(figure=figure, config=GLOBAL_GRAPH_CONFIG)]
 
 
-def stacked_diff_curve(path_valid: Path | None, path_in: Path | None):
-    if (
-        path_valid is None
-        or not path_valid.is_file()
-        or path_in is None
-        or not path_in.is_file()
-    ):
+def stacked_diff_curve(
+    source_valid: Path | pd.DataFrame | None, source_in: Path | pd.DataFrame | None
+):
+    # load the correct files, if necessary
+    data_val = load_prob_data(source_valid)
+    data_in = load_prob_data(source_in)
+    if data_val is None or data_in is None:
         return None
-    # load the correct files
-    data_val = pandas_utils.load_df(path_valid)
-    data_in = pandas_utils.load_df(path_in)
 
-    # get the probability profile differences
+    # get the probability profile differences; use shallow copies as the
+    # compatibility check might modify the data
     data_val, data_in = comparison_indicators.check_data_compatibility(
-        data_val, data_in
+        data_val.copy(deep=False), data_in.copy(deep=False)
     )
     diff = comparison_indicators.calc_probability_curves_diff(data_val, data_in)
     diff = diff.T
@@ -259,20 +274,20 @@ def stacked_diff_curve(path_valid: Path | None, path_in: Path | None):
 def prob_curve_per_activity(
     profile_type_val: profile_category.ProfileCategory,
     profile_type_in: profile_category.ProfileCategory,
-    subdir: Path | str,
+    subdir: str,
 ) -> dict[str, dcc.Graph]:
     # get the path of the validation and the input file
-    path_val = data_utils.get_file_path(
-        datapaths.validation_path / subdir, profile_type_val
-    )
-    path_in = data_utils.get_file_path(
-        datapaths.input_data_path / subdir, profile_type_in
-    )
+    path_val = data_utils.get_statistics_paths(
+        datapaths.validation_path, profile_type_val
+    )[subdir]
+    path_in = data_utils.get_statistics_paths(
+        datapaths.input_data_path, profile_type_in
+    )[subdir]
     if path_val is None or path_in is None:
         return {}
     # load both files
-    validation_data = pandas_utils.load_df(path_val)
-    input_data = pandas_utils.load_df(path_in)
+    validation_data = data_utils.load_df(path_val)
+    input_data = data_utils.load_df(path_in)
 
     # assign time values for the timesteps
     time_values = get_date_range(len(validation_data.columns))
@@ -320,7 +335,7 @@ def prob_curve_per_activity(
 def histogram_per_activity(
     ptype_val: profile_category.ProfileCategory,
     ptype_in: profile_category.ProfileCategory,
-    subdir: Path | str,
+    subdir: str,
     duration_data: bool = False,
 ) -> dict[str, dcc.Graph]:
     """
@@ -336,14 +351,15 @@ def histogram_per_activity(
     :return: a list of Cards containing the individual plots
     """
     # determine file paths for validation and input data
-    path_val = data_utils.get_file_path(datapaths.validation_path / subdir, ptype_val)
-    path_in = data_utils.get_file_path(datapaths.input_data_path / subdir, ptype_in)
+    paths_val = data_utils.get_statistics_paths(datapaths.validation_path, ptype_val)
+    paths_in = data_utils.get_statistics_paths(datapaths.input_data_path, ptype_in)
+    path_val, path_in = paths_val[subdir], paths_in[subdir]
     if path_val is None or path_in is None:
         return {}
 
     # load both files
-    validation_data = pandas_utils.load_df(path_val, duration_data)
-    input_data = pandas_utils.load_df(path_in, duration_data)
+    validation_data = data_utils.load_df(path_val, duration_data)
+    input_data = data_utils.load_df(path_in, duration_data)
     if duration_data:
         # workaround for getting a timedelta axis
         # https://github.com/plotly/plotly.py/issues/799
@@ -393,7 +409,7 @@ def stacked_bar_activity_share(paths: dict[str, Path]) -> Figure:
     :return: bar chart figure
     """
     # load all activity probability files
-    datasets = {k: pandas_utils.load_df(path) for k, path in paths.items()}
+    datasets = {k: data_utils.load_df(path) for k, path in paths.items()}
     # calculate the average probabilities per profile type
     data = pd.DataFrame({title: data.mean(axis=1) for title, data in datasets.items()})
     # add the overall probabilities
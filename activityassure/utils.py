@@ -30,10 +30,12 @@ def timing(f):
 
     @wraps(f)
     def wrap(*args, **kw):
-        ts = time.time()
+        ts = time.perf_counter()
         result = f(*args, **kw)
-        te = time.time()
-        logging.debug("Timing: %r took: %2.4f sec" % (f.__name__, te - ts))
+        te = time.perf_counter()
+        # pass the arguments to the logger, so the message is only
+        # formatted if debug logging is enabled
+        logging.debug("Timing: %r took: %2.4f sec", f.__name__, te - ts)
         return result
 
     return wrap
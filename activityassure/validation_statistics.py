@@ -17,6 +17,7 @@ from activityassure.pandas_utils import (
     save_df,
     load_df,
     create_result_path,
+    find_result_file,
 )
 
 
@@ -114,18 +115,18 @@ class ValidationStatistics:
         :return: the object containing all data for the specified
                  profile type
         """
-        freq_path = create_result_path(
+        freq_path = find_result_file(
             base_path / ValidationStatistics.FREQUENCY_DIR, "freq", profile_type
         )
-        dur_path = create_result_path(
+        dur_path = find_result_file(
             base_path / ValidationStatistics.DURATION_DIR, "dur", profile_type
         )
-        prob_path = create_result_path(
+        prob_path = find_result_file(
             base_path / ValidationStatistics.PROBABILITY_PROFILE_DIR,
             "prob",
             profile_type,
         )
-        if not (freq_path.is_file() and dur_path.is_file() and prob_path.is_file()):
+        if freq_path is None or dur_path is None or prob_path is None:
             raise RuntimeError(
                 f"Did not find all files for profile type {str(profile_type)} in base directory "
                 f"{base_path}"
@@ -3,19 +3,20 @@ Example that demonstrates usage of ETHOS.ActivityAssure by validating
 the LoadProfileGenerator.
 """
 
+from concurrent.futures import ProcessPoolExecutor
 from datetime import timedelta
 import logging
+import os
 from pathlib import Path
 
 from activityassure import activity_mapping, utils, pandas_utils, validation
 from activityassure.input_data_processing import process_model_data
-from activityassure.visualizations import indicator_heatmaps
 from activityassure.validation_statistics import ValidationSet
 
 
 def merge_activities(
     statistics_path: Path, merging_path: Path, new_path: Path | None = None
-):
+) -> ValidationSet:
     """
     Loads validation statistics and merges activities according to the specified file.
     The translated statistics are then saved with a new name
@@ -23,6 +24,7 @@ def merge_activities(
     :param statistics_path: path of validation statistics to adapt
     :param merging_path: path of the merging file to use
     :param new_name: new name for the adapted statistics, by default appends "_mapped"
+    :return: the merged statistics
     """
     # load statistics and merging map and apply the merging
     validation_statistics = ValidationSet.load(statistics_path)
@@ -32,46 +34,88 @@ def merge_activities(
     new_path = new_path or Path(f"{statistics_path}_mapped")
     # save the mapped statistics
     validation_statistics.save(new_path)
+    return validation_statistics
+
+
+def save_variant_results(variant_name: str, metric_dict: dict, result_path: Path):
+    """
+    Saves the indicators of one indicator variant and plots the
+    corresponding heatmaps.
+
+    :param variant_name: name of the indicator variant
+    :param metric_dict: the indicators per profile category
+    :param result_path: base result path for all variants
+    """
+    result_subdir = result_path / variant_name
+    metrics_df = validation.indicator_dict_to_df(metric_dict)
+    pandas_utils.save_df(
+        metrics_df,
+        result_subdir,
+        "indicators_per_category",
+    )
+
+    # plot heatmaps to compare indicator values; the plotting module is only
+    # imported here, as it is slow to import
+    from activityassure.visualizations import indicator_heatmaps
+
+    plot_path = result_subdir / "heatmaps"
+    indicator_heatmaps.plot_indicators_by_profile_type(metrics_df, plot_path)
+    indicator_heatmaps.plot_indicators_by_activity(metrics_df, plot_path)
+    indicator_heatmaps.plot_profile_type_by_activity(metrics_df, plot_path)
 
 
 @utils.timing
 def validate(
-    input_path: Path, validation_path: Path, compare_all_combinations: bool = False
+    input_path: Path,
+    validation_data: Path | ValidationSet,
+    compare_all_combinations: bool = False,
+    input_statistics: ValidationSet | None = None,
 ):
     """
     Load input and validation statistics and compare them
     using indicators and heatmaps.
 
+    :param input_path: path of the input statistics; results are stored here
+    :param validation_data: path of the validation statistics, or the already
+                            loaded statistics
     :param compare_all_combinations: if True, in attition to the normal
                                      per-category validation, all combinations
                                      of profile categories will be checked;
                                      defaults to False
+    :param input_statistics: the already loaded input statistics; if None,
+                             they are loaded from input_path
     """
-    # load LPG statistics and validation statistics
-    input_statistics = ValidationSet.load(input_path)
-    validation_statistics = ValidationSet.load(validation_path)
+    # load LPG statistics and validation statistics, if necessary
+    if input_statistics is None:
+        input_statistics = ValidationSet.load(input_path)
+    if isinstance(validation_data, ValidationSet):
+        validation_statistics = validation_data
+    else:
+        validation_statistics = ValidationSet.load(validation_data)
 
     # compare input and validation data statistics per profile category
     indicator_dict_variants = validation.validate_per_category(
         input_statistics, validation_statistics, input_path
     )
+    if not indicator_dict_variants:
+        raise utils.ActValidatorException("No indicator variants were calculated")
     validation_result_path = input_path / "validation_results"
 
-    # save indicators and heatmaps for each indicator variant
-    for variant_name, metric_dict in indicator_dict_variants.items():
-        result_subdir = validation_result_path / variant_name
-        metrics_df = validation.indicator_dict_to_df(metric_dict)
-        pandas_utils.save_df(
-            metrics_df,
-            result_subdir,
-            "indicators_per_category",
-        )
-
-        # plot heatmaps to compare indicator values
-        plot_path = result_subdir / "heatmaps"
-        indicator_heatmaps.plot_indicators_by_profile_type(metrics_df, plot_path)
-        indicator_heatmaps.plot_indicators_by_activity(metrics_df, plot_path)
-        indicator_heatmaps.plot_profile_type_by_activity(metrics_df, plot_path)
+    # save indicators and heatmaps for each indicator variant in parallel
+    workers = min(len(indicator_dict_variants), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(
+                save_variant_results, variant_name, metric_dict, validation_result_path
+            )
+            for variant_name, metric_dict in indicator_dict_variants.items()
+        ]
+        for future in futures:
+            # raise any exceptions from the worker processes
+            future.result()
+    # the combination heatmaps are stored next to those of the last variant
+    last_variant = list(indicator_dict_variants.keys())[-1]
+    plot_path = validation_result_path / last_variant / "heatmaps"
 
     if compare_all_combinations:
         # compare statistics for each combination of profile categories
@@ -83,6 +127,8 @@ def validate(
         )
 
         # plot heatmaps to compare the different categories to each other
+        from activityassure.visualizations import indicator_heatmaps
+
         indicator_heatmaps.plot_category_comparison(
             indicators_all_combinations, plot_path
         )
@@ -117,7 +163,9 @@ if __name__ == "__main__":
 
     # the LoadProfileGenerator simulates cooking and eating as one activity, therefore these
     # two activities must be merged in the validation statistics
-    merge_activities(validation_stats_path, merging_file, validation_stats_path_merged)
+    validation_statistics = merge_activities(
+        validation_stats_path, merging_file, validation_stats_path_merged
+    )
 
     # calculate statistics for the input model data
     input_statistics = process_model_data.process_model_data(
@@ -126,9 +174,11 @@ if __name__ == "__main__":
         person_trait_file,
         profile_resolution,
         categories_per_person=False,
+        workers=os.cpu_count() or 1,
     )
     # save the created statistics
     input_statistics.save(input_stats_path)
 
-    # validate the input data using the statistics
-    validate(input_stats_path, validation_stats_path_merged)
+    # validate the input data using the statistics; pass the already loaded
+    # statistics to avoid loading them again
+    validate(input_stats_path, validation_statistics, input_statistics=input_statistics)
@@ -0,0 +1,93 @@
+import numpy as np
+import pandas as pd
+
+import activityassure.hetus_data_processing.hetus_column_names as col
+from activityassure.hetus_data_processing import filter, level_extraction
+
+
+def reference_mode(x: pd.Series):
+    # straightforward, but slow implementation of the group mode
+    counts = x.value_counts()
+    return counts.index[0] if len(counts) > 0 else np.nan
+
+
+def test_group_rows_by_level_mode():
+    """
+    Tests the vectorized group mode against a value_counts-based aggregation.
+    """
+    year, country, hid = col.HH.KEY
+    data = pd.DataFrame(
+        {
+            year: 2010,
+            country: "DE",
+            # includes rows with missing key values, which belong to no group
+            hid: [1, 1, 1, 2, 2, 3, 3, 4, 4, 4, 4, np.nan, np.nan, np.nan],
+            # group 1 has a clear mode, groups 2 and 4 contain ties and
+            # group 3 contains only missing values
+            "values": [5, 7, 7, 8, 6, np.nan, np.nan, 2, 1, 1, 2, 9, 9, 9],
+            "labels": ["a", "b", "b", "c", "d", None, None, "e", "f", "f", "e"]
+            + ["x", "x", "x"],
+        }
+    )
+    result = level_extraction.group_rows_by_level(data, col.HH, agg_mode=True)
+    expected = data.groupby(col.HH.KEY).agg(reference_mode)
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+
+def test_group_rows_by_level_first():
+    """
+    Tests selecting the first value per group against groupby().first(), with
+    the keys as columns or as index and with missing values.
+    """
+    year, country, hid = col.HH.KEY
+    data = pd.DataFrame(
+        {
+            year: 2010,
+            country: "DE",
+            hid: [2, 2, 1, 1, 3, np.nan],
+            # the first row of household 2 is missing a value
+            "values": [np.nan, 5, 1, 1, 4, 6],
+        }
+    )
+    expected = data.groupby(col.HH.KEY).first()
+    result = level_extraction.group_rows_by_level(data, col.HH)
+    pd.testing.assert_frame_equal(result, expected)
+    result = level_extraction.group_rows_by_level(data.set_index(col.HH.KEY), col.HH)
+    pd.testing.assert_frame_equal(result, expected)
+    # without missing values, the first rows are selected directly
+    data = data.dropna().set_index(col.HH.KEY)
+    result = level_extraction.group_rows_by_level(data, col.HH)
+    pd.testing.assert_frame_equal(result, data.groupby(col.HH.KEY).first())
+
+
+def test_get_usable_household_data():
+    """
+    Tests the single-pass household filter against the separate checks for
+    complete and consistent households.
+    """
+    data = pd.DataFrame(
+        {
+            col.Year.ID: 2010,
+            col.Country.ID: "DE",
+            col.HH.ID: [1, 1, 1, 2, 2, 3, 3, 4, 4, 5, 5, 6],
+            col.Person.ID: [1, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1],
+            col.Diary.ID: [1, 2, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1],
+            # household 3 is incomplete, household 6 has a missing size
+            col.HH.SIZE: [2, 2, 2, 2, 2, 3, 3, 2, 2, 2, 2, np.nan],
+            # household 4 is inconsistent, household 5 consistently missing
+            "HHC3": [1, 1, 1, 0, 0, 1, 1, 1, 0, np.nan, np.nan, 1],
+            # a column on person level
+            "PAGE4": [30, 30, 40, 20, 25, 50, 55, 60, 65, 70, 75, 80],
+        }
+    ).set_index(col.Diary.KEY)
+    result_data, result_hhdata = level_extraction.get_usable_household_data(data)
+
+    expected_data = filter.filter_by_index(
+        data, level_extraction.get_complete_households(data)
+    )
+    expected_data, expected_hhdata = level_extraction.get_usable_data_by_level(
+        expected_data, col.HH
+    )
+    pd.testing.assert_frame_equal(result_data, expected_data)
+    pd.testing.assert_frame_equal(result_hhdata, expected_hhdata, check_like=True)
+    assert list(result_hhdata.index.get_level_values(col.HH.ID)) == [1, 2, 5]
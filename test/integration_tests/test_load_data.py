@@ -0,0 +1,77 @@
+from io import StringIO
+import numpy as np
+import pandas as pd
+import pytest
+
+import activityassure.hetus_data_processing.hetus_column_names as col
+from activityassure.hetus_data_processing import load_data
+
+
+def test_read_hetus_csv_pyarrow():
+    """
+    Tests that parsing a HETUS file with pyarrow gives the same result as
+    parsing it with pandas.
+    """
+    pytest.importorskip("pyarrow")
+    path = "test/test_data/time use survey data/TUS_SUF_A_TEST_2010.csv"
+    expected = pd.read_csv(path, dtype=load_data.build_dtype_dict())
+    result = load_data.read_hetus_csv(path, use_pyarrow=True)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_load_hetus_files_pyarrow():
+    """
+    Tests that the HETUS loading functions return the same data with pyarrow.
+    """
+    pytest.importorskip("pyarrow")
+    path = "test/test_data/time use survey data"
+    expected = load_data.load_hetus_files(["TEST"], path)
+    result = load_data.load_hetus_files(["TEST"], path, use_pyarrow=True)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_read_hetus_csv_pyarrow_empty_column():
+    """
+    Tests that columns without any values get the same dtype with pyarrow
+    as with pandas.
+    """
+    pytest.importorskip("pyarrow")
+    content = "HID,PID,EMPTY\n1,1,\n1,2,\n"
+    expected = pd.read_csv(StringIO(content), dtype=load_data.build_dtype_dict())
+    result = load_data.read_hetus_csv(StringIO(content), use_pyarrow=True)
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_shrink_dtypes():
+    """
+    Tests that shrink_dtypes converts the columns to smaller dtypes without
+    changing any values.
+    """
+    data = pd.DataFrame(
+        {
+            col.HH.ID: [1, 2, 3, 4],
+            "SMALL": [-1, 0, 5, 100],
+            "MEDIUM": [-1, 0, 5, 1000],
+            "LARGE": [0, 1, 2, 2**40],
+            "TEXT": ["a", "a", "a", "a"],
+            "UNIQUE_TEXT": ["a", "b", "c", "d"],
+            "MACT1": ["0110", "0110", "0110", "0120"],
+        }
+    )
+    result = load_data.shrink_dtypes(data)
+    expected_dtypes = {
+        col.HH.ID: np.int64,
+        "SMALL": np.int8,
+        "MEDIUM": np.int16,
+        "LARGE": np.int64,
+        "TEXT": "category",
+        "UNIQUE_TEXT": data["UNIQUE_TEXT"].dtype,
+        # diary codes are translated later on and remain unchanged
+        "MACT1": data["MACT1"].dtype,
+    }
+    assert result.dtypes.to_dict() == expected_dtypes
+    # the values are not changed and the original data is not modified
+    pd.testing.assert_frame_equal(
+        result, data, check_dtype=False, check_categorical=False
+    )
+    assert (data.dtypes == np.int64).sum() == 4
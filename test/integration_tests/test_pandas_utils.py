@@ -0,0 +1,48 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from activityassure import pandas_utils
+
+
+def create_data() -> pd.DataFrame:
+    index = pd.to_timedelta(["0 days 00:10:00", "0 days 00:20:00"])
+    return pd.DataFrame({"sleep": [0.5, 0.25], "work": [0.5, 0.75]}, index=index)
+
+
+def test_find_and_load_csv(tmp_path: Path):
+    """
+    Tests saving, finding and loading a csv file.
+    """
+    data = create_data()
+    assert pandas_utils.find_result_file(tmp_path, "probabilities") is None
+    pandas_utils.save_df(data, tmp_path, "probabilities")
+    path = pandas_utils.find_result_file(tmp_path, "probabilities")
+    assert path == tmp_path / "probabilities.csv"
+    result = pandas_utils.load_df(path, timedelta_index=True)
+    pd.testing.assert_frame_equal(result, data, check_freq=False)
+
+
+def test_convert_to_parquet(tmp_path: Path):
+    """
+    Tests converting csv files to parquet and loading the result.
+    """
+    pytest.importorskip("pyarrow")
+    data = create_data()
+    pandas_utils.save_df(data, tmp_path, "probabilities")
+    expected = pandas_utils.load_df(tmp_path / "probabilities.csv")
+
+    # the csv files are kept by default
+    pandas_utils.convert_to_parquet(tmp_path)
+    parquet_path = tmp_path / f"probabilities.{pandas_utils.PARQUET_EXT}"
+    assert (tmp_path / "probabilities.csv").is_file()
+    assert parquet_path.is_file()
+    pd.testing.assert_frame_equal(pandas_utils.load_df(parquet_path), expected)
+
+    pandas_utils.convert_to_parquet(tmp_path, keep_csv=False)
+    assert not (tmp_path / "probabilities.csv").exists()
+    path = pandas_utils.find_result_file(tmp_path, "probabilities")
+    assert path == parquet_path
+    result = pandas_utils.load_df(path, timedelta_index=True)
+    pd.testing.assert_frame_equal(result, data, check_freq=False)